@@ -0,0 +1,85 @@
+import streamlit as st
+import pandas as pd
+from steam_core import (
+    GEMINI_API_KEY,
+    PAGE_SIZE,
+    get_data_key,
+    get_model,
+    get_rows,
+    show_ai_answer,
+    simple_chatbot,
+)
+
+# =====================
+# PAGE CONFIG
+# =====================
+st.set_page_config(
+    page_title="Steam AI Assistant",
+    page_icon="🎮",
+    layout="wide"
+)
+
+# =====================
+# LOAD GEMINI
+# =====================
+USE_AI = False
+
+if GEMINI_API_KEY:
+    try:
+        get_model(GEMINI_API_KEY)
+        USE_AI = True
+    except Exception as e:
+        st.warning(f"⚠ Gemini API error: {str(e)}")
+        USE_AI = False
+
+DATA_KEY = get_data_key()
+
+# =====================
+# HEADER
+# =====================
+st.title("🎮 Steam Games AI Assistant")
+
+# =====================
+# SIDEBAR
+# =====================
+with st.sidebar:
+    st.success("✅ Gemini AI Connected" if USE_AI else "⚠ AI Disabled")
+    show_data = st.checkbox("📊 Show Dataset", False)
+    use_ai = st.checkbox("🤖 Enable AI Answer", USE_AI)
+
+    st.markdown("---")
+    st.markdown("### 💡 Try asking:")
+    st.markdown("""
+    - total games  
+    - average price  
+    - top genre  
+    - top developer  
+    - games per year  
+    - summary / insights  
+    """)
+
+# =====================
+# UI
+# =====================
+query = st.text_input(
+    "Ask something about the Steam games data",
+    placeholder="e.g. What is the average price of games?"
+)
+
+if query:
+    st.markdown("### 🔍 Result")
+
+    result = simple_chatbot(query)
+
+    if isinstance(result, pd.DataFrame):
+        st.dataframe(result, use_container_width=True)
+    else:
+        st.success(result)
+
+    if use_ai and USE_AI:
+        st.markdown("### 🤖 AI Explanation (Gemini)")
+        show_ai_answer(query)
+
+if show_data:
+    st.markdown("### 📊 Dataset Preview")
+    st.dataframe(get_rows(DATA_KEY, 0, PAGE_SIZE), use_container_width=True)
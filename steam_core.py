@@ -0,0 +1,305 @@
+import streamlit as st
+import pandas as pd
+import pyarrow as pa
+import os
+import re
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dotenv import load_dotenv, find_dotenv
+
+logger = logging.getLogger(__name__)
+
+# Shared data, caches and chatbot logic for every page. Streamlit imports
+# this module once per process, so pages reuse the same cached artifacts
+# instead of each loading the data and configuring Gemini on its own.
+
+# =====================
+# CONFIG
+# =====================
+DATA_PATH = "data/a_steam_data_2021_2025.csv"
+PAGE_SIZE = 50
+
+# Only the columns the app shows or aggregates, with compact dtypes so
+# value_counts/groupby run on integer codes instead of Python strings.
+DATA_COLUMNS = [
+    "name", "release_year", "release_date", "genres",
+    "price", "recommendations", "developer", "publisher",
+]
+DATA_DTYPES = {
+    "release_year": "int16",
+    "price": "float32",
+    "recommendations": "int32",
+    "genres": "category",
+    "developer": "category",
+}
+
+# The Parquet copy's name carries a hash of the column/dtype spec, so
+# changing either never reuses a file written with the old schema.
+SCHEMA_TAG = hashlib.sha1(
+    repr((DATA_COLUMNS, sorted(DATA_DTYPES.items()))).encode()
+).hexdigest()[:8]
+PARQUET_PREFIX = "data/a_steam_data_2021_2025."
+
+load_dotenv(find_dotenv())
+GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+# Correct model name
+GEMINI_MODEL = "models/gemini-2.5-flash-lite"
+AI_CACHE_SIZE = 256
+AI_CACHE_TTL = 3600  # seconds
+# Hard caps so a wide schema or a long question can't inflate latency/cost
+MAX_PROMPT_CHARS = 4000
+MAX_QUESTION_CHARS = 500
+GENERATION_CONFIG = {"max_output_tokens": 512, "temperature": 0.2}
+
+# =====================
+# LOAD DATA
+# =====================
+# cache_resource hands back the same DataFrame without re-hashing it on
+# every access; callers must treat it as read-only.
+# A typed Parquet copy is written on the first cold start and reused until
+# the CSV changes, so later cold starts skip CSV parsing. Keyed on the data
+# key so a changed CSV is actually reloaded; only the latest frame is kept.
+@st.cache_resource(max_entries=1)
+def get_df(data_key):
+    parquet_path = get_parquet_path()
+    if os.path.exists(parquet_path):
+        try:
+            return pd.read_parquet(parquet_path)
+        except Exception as e:
+            logger.warning("Rebuilding unreadable %s: %s", parquet_path, e)
+    data = pd.read_csv(DATA_PATH, usecols=DATA_COLUMNS, dtype=DATA_DTYPES)
+    # Write to a per-process temp file and swap it in atomically, so an
+    # interrupted or concurrent write never leaves a partial Parquet file.
+    tmp_path = f"{parquet_path}.{os.getpid()}.tmp"
+    try:
+        data.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, parquet_path)
+    except (OSError, ImportError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+    return data
+
+# The copy is tied to the exact CSV it was built from (mtime + size), not
+# just "newer than the CSV", so a CSV restored with an older mtime is never
+# served from a stale copy.
+def get_parquet_path():
+    stat = os.stat(DATA_PATH)
+    return f"{PARQUET_PREFIX}{SCHEMA_TAG}.{stat.st_mtime_ns}-{stat.st_size}.parquet"
+
+# Identifies the current dataset version for the caches below.
+def get_data_key():
+    return (DATA_PATH, os.path.getmtime(DATA_PATH))
+
+# Most frequent value without sorting the whole count table.
+def top_value(s):
+    return s.value_counts(sort=False).idxmax()
+
+# Aggregates only depend on the CSV, so they are keyed on path + mtime
+# instead of hashing the whole DataFrame on every rerun.
+@st.cache_data
+def get_summary(data_key):
+    df = get_df(data_key)
+    return {
+        "n": len(df),
+        "avg_price": df["price"].mean(),
+        "top_genre": top_value(df["genres"]),
+        "top_dev": top_value(df["developer"]),
+        "per_year": (
+            df["release_year"]
+            .value_counts(dropna=False, sort=False)
+            .sort_index()
+            .rename_axis("release_year")
+        ),
+        "top_genres": df["genres"].value_counts(sort=False).nlargest(10),
+        "top_devs": df["developer"].value_counts(sort=False).nlargest(10),
+    }
+
+# st.cache_data hands back a fresh copy on every call, so each session keeps
+# its own copy and reruns skip deserializing the summary again.
+def session_summary():
+    data_key = get_data_key()
+    if st.session_state.get("summary_key") != data_key:
+        st.session_state["summary"] = get_summary(data_key)
+        st.session_state["summary_key"] = data_key
+    return st.session_state["summary"]
+
+# Row slices are converted to Arrow once and cached, so reruns skip both the
+# slice and the pandas -> Arrow conversion st.dataframe would do. Unused
+# categories are dropped first, otherwise every page would carry the full
+# genre/developer dictionaries (~1 MB) instead of just its own 50 rows.
+@st.cache_data(max_entries=64)
+def get_rows(data_key, start, stop):
+    rows = get_df(data_key).iloc[start:stop].copy()
+    for col in rows.select_dtypes("category"):
+        rows[col] = rows[col].cat.remove_unused_categories()
+    return pa.Table.from_pandas(rows, preserve_index=False)
+
+# Compact schema + aggregates sent to Gemini instead of raw sample rows.
+@st.cache_data
+def get_dataset_brief(data_key):
+    df = get_df(data_key)
+    summary = get_summary(data_key)
+    return (
+        f"ROWS: {summary['n']}\n\n"
+        f"COLUMNS:\n{df.dtypes.to_string()}\n\n"
+        f"STATISTICS:\n{df.describe(include='all').round(2).to_csv()}\n"
+        f"TOP 10 GENRES:\n{summary['top_genres'].to_csv()}\n"
+        f"TOP 10 DEVELOPERS:\n{summary['top_devs'].to_csv()}\n"
+        f"GAMES PER YEAR:\n{summary['per_year'].to_csv()}"
+    )
+
+QUESTION_PROMPT = """
+QUESTION:
+{question}
+
+Give a clear and concise answer.
+"""
+# What is left for the dataset preamble once the longest allowed question
+# is added, so the full prompt never exceeds MAX_PROMPT_CHARS.
+DATA_PROMPT_CHARS = (
+    MAX_PROMPT_CHARS - MAX_QUESTION_CHARS - len(QUESTION_PROMPT.format(question=""))
+)
+
+def get_data_prompt(data_key):
+    prompt = f"""
+You are a data analyst.
+Answer ONLY using the Steam dataset below.
+
+DATASET SUMMARY:
+{get_dataset_brief(data_key)}
+"""
+    if len(prompt) > DATA_PROMPT_CHARS:
+        # Cut on a line boundary so no half CSV row is sent
+        prompt = prompt[:DATA_PROMPT_CHARS].rsplit("\n", 1)[0] + "\n"
+    return prompt
+
+# =====================
+# GEMINI
+# =====================
+# Configured once per process; reruns reuse the same client. The SDK
+# (gRPC + protobufs) is only imported here, so pages that never use Gemini
+# don't pay for it.
+@st.cache_resource
+def get_model(api_key):
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel(GEMINI_MODEL)
+
+def gemini_generate(question, stream=False):
+    data_key = get_data_key()
+    question_prompt = QUESTION_PROMPT.format(question=question[:MAX_QUESTION_CHARS])
+    model = get_model(GEMINI_API_KEY)
+    return model.generate_content(
+        get_data_prompt(data_key) + question_prompt,
+        generation_config=GENERATION_CONFIG,
+        stream=stream,
+    )
+
+# Recent answers keyed on (normalized question, data key), shared across
+# sessions so repeated questions skip the API call. Held in cache_resource
+# rather than st.cache_data because the answer streams into a placeholder
+# that lives outside the cached function.
+@st.cache_resource
+def get_answer_cache():
+    return {"answers": OrderedDict(), "lock": threading.Lock()}
+
+def normalize_question(question):
+    return " ".join(re.sub(r"[^\w\s]", " ", question.lower()).split())
+
+def lookup_answer(key):
+    cache = get_answer_cache()
+    with cache["lock"]:
+        hit = cache["answers"].get(key)
+        if hit is None or time.time() - hit[0] > AI_CACHE_TTL:
+            return None
+        cache["answers"].move_to_end(key)
+        return hit[1]
+
+def store_answer(key, text):
+    cache = get_answer_cache()
+    with cache["lock"]:
+        cache["answers"][key] = (time.time(), text)
+        cache["answers"].move_to_end(key)
+        while len(cache["answers"]) > AI_CACHE_SIZE:
+            cache["answers"].popitem(last=False)
+
+# =====================
+# RULE-BASED CHATBOT
+# =====================
+# IGNORECASE avoids lowercasing (and copying) every query before matching
+INTENT_RE = re.compile(
+    r"(total games|average price|top genre|top developer|games per year|summary|insight)",
+    re.IGNORECASE,
+)
+
+def summary_text(summary):
+    return (
+        f"📊 Steam Dataset Summary:\n"
+        f"- Total Games: {summary['n']}\n"
+        f"- Average Price: ${summary['avg_price']:.2f}\n"
+        f"- Top Genre: {summary['top_genre']}\n"
+        f"- Top Developer: {summary['top_dev']}"
+    )
+
+INTENT_HANDLERS = {
+    "total games": lambda s: f"🎮 Total Games: {s['n']}",
+    "average price": lambda s: f"💲 Average Price: ${s['avg_price']:.2f}",
+    "top genre": lambda s: f"🏆 Top Genre: {s['top_genre']}",
+    "top developer": lambda s: f"🏢 Top Developer: {s['top_dev']}",
+    "games per year": lambda s: s["per_year"].to_frame("games"),
+    "summary": summary_text,
+    "insight": summary_text,
+}
+
+# One regex scan picks the intent instead of a chain of substring tests
+def simple_chatbot(q):
+    match = INTENT_RE.search(q)
+    if match:
+        return INTENT_HANDLERS[match.group(1).lower()](session_summary())
+    return "❌ Try: total games, average price, top genre, top developer"
+
+# =====================
+# GEMINI AI CHATBOT
+# =====================
+# Returns (answer, ok); ok is False when the answer is an error message.
+def ai_chatbot(question, placeholder):
+    if not GEMINI_API_KEY:
+        return "⚠ AI is not enabled or API key is invalid.", False
+
+    try:
+        data_key = get_data_key()
+        key = (normalize_question(question), data_key)
+        cached = lookup_answer(key)
+        if cached is not None:
+            return cached, True
+
+        # Stream so the answer renders as tokens arrive
+        response = gemini_generate(question, stream=True)
+        text = ""
+        for chunk in response:
+            text += chunk.text
+            placeholder.info(text)
+        store_answer(key, text)
+        return text, True
+    except Exception as e:
+        return f"❌ Gemini API error: {str(e)}", False
+
+def show_ai_answer(query):
+    placeholder = st.empty()
+    # Reruns for the same question (e.g. toggling a checkbox) reuse the
+    # last answer instead of calling Gemini again
+    last = st.session_state.get("ai_answer")
+    if last and last["question"] == query:
+        placeholder.info(last["answer"])
+    else:
+        answer, ok = ai_chatbot(query, placeholder)
+        placeholder.info(answer)
+        # Errors are not kept, so the next rerun retries the call
+        if ok:
+            st.session_state["ai_answer"] = {"question": query, "answer": answer}